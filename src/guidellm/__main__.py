@@ -206,8 +206,8 @@ def cli():
     help=(
         "The path to save the output to. If it is a directory, "
         "it will save benchmarks.json under it. "
-        "Otherwise, json, yaml, or csv files are supported for output types "
-        "which will be read from the extension for the file path."
+        "Otherwise, json, yaml, csv, or pickle (.pkl) files are supported for "
+        "output types which will be read from the extension for the file path."
     ),
 )
 @click.option(
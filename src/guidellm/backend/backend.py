@@ -146,6 +146,14 @@ class Backend(ABC):
         """
         ...
 
+    async def close(self):
+        """
+        Release any resources, such as open connections, held by the backend.
+        The backend must remain usable after closing and re-create any resources
+        it needs on the next request.
+        """
+        return
+
     @abstractmethod
     async def available_models(self) -> list[str]:
         """
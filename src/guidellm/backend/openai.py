@@ -1,11 +1,11 @@
 import base64
-import json
 import time
 from collections.abc import AsyncGenerator
 from pathlib import Path
 from typing import Any, Literal, Optional, Union
 
 import httpx
+import orjson
 from loguru import logger
 from PIL import Image
 
@@ -35,6 +35,102 @@ CHAT_COMPLETIONS: EndpointType = "chat_completions"
 MODELS: EndpointType = "models"
 TEXT_COMPLETIONS: EndpointType = "text_completions"
 
+_SSE_DATA_PREFIX = b"data:"
+_SSE_DATA_PREFIX_LEN = len(_SSE_DATA_PREFIX)
+_SSE_DONE = b"[DONE]"
+
+
+class _SSEDataParser:
+    """
+    Incremental parser for the JSON data of server-sent events.
+    Raw bytes are buffered and only complete lines are parsed,
+    since a network chunk may hold several SSE lines or only part of one.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        # data for the current event, which may span multiple data lines
+        self.event_data = bytearray()
+        self.done = False
+        # tallied for a single log at the end rather than per line
+        self.line_count = 0
+        self.ignored_count = 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Add a chunk of the stream and parse any lines it completes.
+
+        :param chunk: The raw bytes received from the stream.
+        :return: The data of each event completed by the chunk.
+        """
+        self.buffer += chunk
+
+        if b"\n" not in chunk:
+            # no new complete lines, skip rescanning the buffered data
+            # so large events arriving over many reads stay linear
+            return []
+
+        *lines, self.buffer = self.buffer.split(b"\n")
+
+        return self._parse_lines(lines)
+
+    def flush(self) -> list[Any]:
+        """
+        Parse the remaining buffered data once the stream has ended,
+        including a final line or event without a trailing newline.
+
+        :return: The data of each remaining event.
+        """
+        if self.done:
+            return []
+
+        lines = [self.buffer] if self.buffer else []
+        self.buffer = bytearray()
+        # a blank line ends the final event so its data must parse or raise
+        lines.append(bytearray())
+
+        return self._parse_lines(lines)
+
+    def _parse_lines(self, lines: list[bytearray]) -> list[Any]:
+        loads = orjson.loads
+        events = []
+        self.line_count += len(lines)
+
+        for line in lines:
+            # SSE field names start the line, so only the value needs
+            # stripping and whole lines are never copied
+            if line.startswith(_SSE_DATA_PREFIX):
+                line_data = line[_SSE_DATA_PREFIX_LEN:].strip()
+                if line_data == _SSE_DONE:
+                    self.done = True
+                    break
+
+                if self.event_data:
+                    self.event_data += b"\n"
+                self.event_data += line_data
+
+                if not self.event_data.endswith((b"}", b"]")):
+                    # can't be a complete JSON value, wait for more data
+                    continue
+
+                try:
+                    events.append(loads(self.event_data))
+                except orjson.JSONDecodeError:
+                    continue
+            elif line.strip():
+                # comment or non data field, nothing to parse
+                self.ignored_count += 1
+                continue
+            elif self.event_data:
+                # end of the event, remaining data must parse or raise
+                events.append(loads(self.event_data))
+            else:
+                continue
+
+            self.event_data.clear()
+
+        return events
+
 
 @Backend.register("openai_http")
 class OpenAIHTTPBackend(Backend):
@@ -61,6 +157,11 @@ class OpenAIHTTPBackend(Backend):
         If not provided, the default timeout provided from settings is used.
     :param http2: If True, uses HTTP/2 for requests to the OpenAI server.
         Defaults to True.
+    :param http2_prior_knowledge: If True along with http2, requests are sent over
+        HTTP/2 without negotiation, enabling multiplexed streams for cleartext
+        (http://) targets that would otherwise fall back to HTTP/1.1.
+        The target server must support HTTP/2 over cleartext.
+        If not provided, the default value from settings is used.
     :param follow_redirects: If True, the HTTP client will follow redirect responses.
         If not provided, the default value from settings is used.
     :param max_output_tokens: The maximum number of tokens to request for completions.
@@ -81,6 +182,7 @@ class OpenAIHTTPBackend(Backend):
         project: Optional[str] = None,
         timeout: Optional[float] = None,
         http2: Optional[bool] = True,
+        http2_prior_knowledge: Optional[bool] = None,
         follow_redirects: Optional[bool] = None,
         max_output_tokens: Optional[int] = None,
         extra_query: Optional[dict] = None,
@@ -110,6 +212,11 @@ class OpenAIHTTPBackend(Backend):
         self.project = project or settings.openai.project
         self.timeout = timeout if timeout is not None else settings.request_timeout
         self.http2 = http2 if http2 is not None else settings.request_http2
+        self.http2_prior_knowledge = (
+            http2_prior_knowledge
+            if http2_prior_knowledge is not None
+            else settings.request_http2_prior_knowledge
+        )
         self.follow_redirects = (
             follow_redirects
             if follow_redirects is not None
@@ -123,6 +230,7 @@ class OpenAIHTTPBackend(Backend):
         self.extra_query = extra_query
         self.extra_body = extra_body
         self._async_client: Optional[httpx.AsyncClient] = None
+        self._cached_headers: Optional[dict[str, str]] = None
 
     @property
     def target(self) -> str:
@@ -149,6 +257,7 @@ class OpenAIHTTPBackend(Backend):
             "max_output_tokens": self.max_output_tokens,
             "timeout": self.timeout,
             "http2": self.http2,
+            "http2_prior_knowledge": self.http2_prior_knowledge,
             "follow_redirects": self.follow_redirects,
             "authorization": bool(self.authorization),
             "organization": self.organization,
@@ -184,6 +293,13 @@ class OpenAIHTTPBackend(Backend):
         Clears out the sync and async clients to ensure they are re-initialized
         for each process.
         """
+        await self.close()
+
+    async def close(self):
+        """
+        Close the async client and its pooled connections, if created.
+        The client is lazily re-created on the next request.
+        """
         if self._async_client is not None:
             await self._async_client.aclose()
             self._async_client = None
@@ -358,12 +474,31 @@ class OpenAIHTTPBackend(Backend):
         """
         Get the async HTTP client for making requests.
         If the client has not been created yet, it will create one.
+        The client is reused across requests so pooled keep-alive connections
+        are shared rather than paying a new connection setup per request.
+        The pool is unbounded since concurrency is enforced by the scheduler.
+        Idle connections expire after httpx's default keep-alive expiry unless
+        settings.request_keepalive_expiry overrides it.
 
         :return: The async HTTP client.
         """
         if self._async_client is None:
-            client = httpx.AsyncClient(
+            keepalive_expiry = settings.request_keepalive_expiry
+            if keepalive_expiry is None:
+                # None would disable the expiry in httpx, keep its default instead
+                keepalive_expiry = httpx.Limits().keepalive_expiry
+
+            transport = httpx.AsyncHTTPTransport(
+                http1=not (self.http2 and self.http2_prior_knowledge),
                 http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=None,
+                    max_keepalive_connections=None,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+            client = httpx.AsyncClient(
+                transport=transport,
                 timeout=self.timeout,
                 follow_redirects=self.follow_redirects,
             )
@@ -374,6 +509,11 @@ class OpenAIHTTPBackend(Backend):
         return client
 
     def _headers(self) -> dict[str, str]:
+        # headers are static for the instance, build once and share across
+        # requests; httpx copies them into the request rather than mutating
+        if self._cached_headers is not None:
+            return self._cached_headers
+
         headers = {
             "Content-Type": "application/json",
         }
@@ -387,6 +527,8 @@ class OpenAIHTTPBackend(Backend):
         if self.project:
             headers["OpenAI-Project"] = self.project
 
+        self._cached_headers = headers
+
         return headers
 
     def _params(self, endpoint_type: EndpointType) -> dict[str, str]:
@@ -422,8 +564,10 @@ class OpenAIHTTPBackend(Backend):
         max_output_tokens: Optional[int],
         **kwargs,
     ) -> dict:
-        payload = body or {}
-        payload.update(orig_kwargs or {})
+        # build a new dict so the instance's extra_body is never mutated
+        payload = {**body} if body else {}
+        if orig_kwargs:
+            payload.update(orig_kwargs)
         payload.update(kwargs)
         payload["model"] = self.model
         payload["stream"] = True
@@ -529,7 +673,7 @@ class OpenAIHTTPBackend(Backend):
 
         logger.info(
             "{} making request: {} to target: {} using http2: {} following "
-            "redirects: {} for timeout: {} with headers: {} and params: {} and ",
+            "redirects: {} for timeout: {} with headers: {} and params: {} and "
             "payload: {}",
             self.__class__.__name__,
             request_id,
@@ -542,12 +686,11 @@ class OpenAIHTTPBackend(Backend):
             payload,
         )
 
-        response_value = ""
+        response_value_parts: list[str] = []
         response_prompt_count: Optional[int] = None
         response_output_count: Optional[int] = None
         iter_count = 0
         start_time = time.time()
-        iter_time = start_time
         first_iter_time: Optional[float] = None
         last_iter_time: Optional[float] = None
 
@@ -564,39 +707,57 @@ class OpenAIHTTPBackend(Backend):
 
         # reset start time after yielding start response to ensure accurate timing
         start_time = time.time()
+        iter_time = start_time
+        # later timestamps are offsets from a monotonic clock anchored at the
+        # wall clock start_time, so a wall clock adjustment mid request can't
+        # skew the timings while they remain comparable to other time.time() values
+        start_ns = time.monotonic_ns()
 
+        # bind lookups used for every read to locals for the loop
+        extract_delta = self._extract_completions_delta_content
+        extract_usage = self._extract_completions_usage
+
+        # serialize with orjson rather than httpx's stdlib json encoding,
+        # headers already carry the application/json content type
         async with self._get_async_client().stream(
-            "POST", target, headers=headers, params=params, json=payload
+            "POST",
+            target,
+            headers=headers,
+            params=params,
+            content=orjson.dumps(payload),
         ) as stream:
             stream.raise_for_status()
 
-            async for line in stream.aiter_lines():
-                iter_time = time.time()
-                logger.debug(
-                    "{} request: {} recieved iter response line: {}",
-                    self.__class__.__name__,
-                    request_id,
-                    line,
-                )
+            async for iter_time, events in self._iter_stream_events(
+                stream, start_time, start_ns, request_id
+            ):
+                # events received within the same read share a timestamp,
+                # coalesce them into a single streaming response
+                chunk_deltas: list[str] = []
 
-                if not line or not line.strip().startswith("data:"):
-                    continue
+                for data in events:
+                    if delta := extract_delta(type_, data):
+                        iter_count += 1
+                        chunk_deltas.append(delta)
 
-                if line.strip() == "data: [DONE]":
-                    break
+                    if usage := extract_usage(data):
+                        response_prompt_count = usage["prompt"]
+                        response_output_count = usage["output"]
 
-                data = json.loads(line.strip()[len("data: ") :])
-                if delta := self._extract_completions_delta_content(type_, data):
+                if chunk_deltas:
                     if first_iter_time is None:
                         first_iter_time = iter_time
                     last_iter_time = iter_time
 
-                    iter_count += 1
-                    response_value += delta
+                    delta = "".join(chunk_deltas)
+                    response_value_parts.append(delta)
 
-                    yield StreamingTextResponse(
+                    # constructed on every read from known typed values,
+                    # skip pydantic validation; only the delta is sent, the
+                    # parts are joined once for the final response
+                    yield StreamingTextResponse.model_construct(
                         type_="iter",
-                        value=response_value,
+                        value="",
                         iter_count=iter_count,
                         start_time=start_time,
                         first_iter_time=first_iter_time,
@@ -605,13 +766,10 @@ class OpenAIHTTPBackend(Backend):
                         request_id=request_id,
                     )
 
-                if usage := self._extract_completions_usage(data):
-                    response_prompt_count = usage["prompt"]
-                    response_output_count = usage["output"]
-
+        response_value = "".join(response_value_parts)
         logger.info(
-            "{} request: {} with headers: {} and params: {} and payload: {} completed"
-            "with: {}",
+            "{} request: {} with headers: {} and params: {} and payload: {} "
+            "completed with: {}",
             self.__class__.__name__,
             request_id,
             headers,
@@ -643,18 +801,52 @@ class OpenAIHTTPBackend(Backend):
             request_id=request_id,
         )
 
+    async def _iter_stream_events(
+        self,
+        stream: httpx.Response,
+        start_time: float,
+        start_ns: int,
+        request_id: Optional[str],
+    ) -> AsyncGenerator[tuple[float, list[Any]], None]:
+        parser = _SSEDataParser()
+        iter_time = start_time
+        # bound locally and computed inline, this runs for every read
+        monotonic_ns = time.monotonic_ns
+
+        async for chunk in stream.aiter_bytes():
+            # timestamp on receipt, before any parsing, so parse cost for
+            # this read is never attributed to the server's response timing
+            iter_time = start_time + (monotonic_ns() - start_ns) / 1e9
+            yield iter_time, parser.feed(chunk)
+
+            if parser.done:
+                break
+        else:
+            # the stream ended, the last event may lack its trailing newline
+            if events := parser.flush():
+                yield iter_time, events
+
+        logger.debug(
+            "{} request: {} received {} stream lines, ignored {} non data lines",
+            self.__class__.__name__,
+            request_id,
+            parser.line_count,
+            parser.ignored_count,
+        )
+
     @staticmethod
     def _extract_completions_delta_content(
         type_: Literal["text_completions", "chat_completions"], data: dict
     ) -> Optional[str]:
-        if "choices" not in data or not data["choices"]:
-            return None
-
-        if type_ == "text_completions":
-            return data["choices"][0]["text"]
+        try:
+            if type_ == "text_completions":
+                return data["choices"][0]["text"]
 
-        if type_ == "chat_completions":
-            return data["choices"][0]["delta"]["content"]
+            if type_ == "chat_completions":
+                return data["choices"][0]["delta"]["content"]
+        except (KeyError, IndexError, TypeError):
+            # usage only or content free chunk (e.g. a role only chat delta)
+            return None
 
         raise ValueError(f"Unsupported type: {type_}")
 
@@ -662,10 +854,10 @@ class OpenAIHTTPBackend(Backend):
     def _extract_completions_usage(
         data: dict,
     ) -> Optional[dict[Literal["prompt", "output"], int]]:
-        if "usage" not in data or not data["usage"]:
+        if not (usage := data.get("usage")):
             return None
 
         return {
-            "prompt": data["usage"]["prompt_tokens"],
-            "output": data["usage"]["completion_tokens"],
+            "prompt": usage["prompt_tokens"],
+            "output": usage["completion_tokens"],
         }
@@ -21,10 +21,14 @@ class StreamingTextResponse(StandardBaseModel):
     A model representing the response content for a streaming text request.
 
     :param type_: The type of the response; either 'start' or 'iter'.
-    :param value: The value of the response up to this iteration.
+    :param value: The value of the response up to this iteration, if the backend
+        tracks it. Backends may leave it empty for 'iter' responses rather than
+        rebuilding the text on every iteration, so consumers that need the text
+        mid stream should accumulate the deltas instead.
     :param start_time: The time.time() the request started.
     :param iter_count: The iteration count for the response. For 'start' this is 0
-        and for the first 'iter' it is 1.
+        and for the first 'iter' it is the number of iterations received with it.
+        Iterations that arrive together are combined into a single response.
     :param delta: The text delta added to the response for this stream iteration.
     :param time: If 'start', the time.time() the request started.
         If 'iter', the time.time() the iteration was received.
@@ -1,7 +1,9 @@
+import math
 import time
 import uuid
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Iterable
+from functools import cached_property
 from pathlib import Path
 from typing import (
     Any,
@@ -11,7 +13,7 @@ from typing import (
     Union,
 )
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from transformers import PreTrainedTokenizerBase  # type: ignore  # noqa: PGH003
 
 from guidellm.backend import Backend, ResponseSummary
@@ -22,6 +24,7 @@ from guidellm.benchmark.aggregator import (
 )
 from guidellm.benchmark.benchmark import BenchmarkArgs, GenerativeBenchmark
 from guidellm.benchmark.profile import Profile
+from guidellm.config import settings
 from guidellm.objects import StandardBaseModel
 from guidellm.request import (
     GenerationRequest,
@@ -63,6 +66,9 @@ class BenchmarkerResult(
 
 
 class BenchmarkerStrategyLimits(StandardBaseModel):
+    # frozen so the derived limits can be computed once and cached
+    model_config = ConfigDict(frozen=True)
+
     requests_loader_size: Optional[int] = Field(
         description="Size of the request loader.",
     )
@@ -85,7 +91,7 @@ class BenchmarkerStrategyLimits(StandardBaseModel):
         le=1,
     )
 
-    @property
+    @cached_property
     def max_number(self) -> Optional[int]:
         if self.max_number_per_strategy is not None:
             return self.max_number_per_strategy
@@ -95,32 +101,32 @@ class BenchmarkerStrategyLimits(StandardBaseModel):
 
         return None
 
-    @property
+    @cached_property
     def max_duration(self) -> Optional[float]:
         return self.max_duration_per_strategy
 
-    @property
+    @cached_property
     def warmup_number(self) -> Optional[int]:
         if self.warmup_percent_per_strategy is None or self.max_number is None:
             return None
 
         return int(self.warmup_percent_per_strategy * self.max_number)
 
-    @property
+    @cached_property
     def warmup_duration(self) -> Optional[float]:
         if self.warmup_percent_per_strategy is None or self.max_duration is None:
             return None
 
         return self.warmup_percent_per_strategy * self.max_duration
 
-    @property
+    @cached_property
     def cooldown_number(self) -> Optional[int]:
         if self.cooldown_percent_per_strategy is None or self.max_number is None:
             return None
 
         return int(self.cooldown_percent_per_strategy * self.max_number)
 
-    @property
+    @cached_property
     def cooldown_duration(self) -> Optional[float]:
         if self.cooldown_percent_per_strategy is None or self.max_duration is None:
             return None
@@ -153,19 +159,14 @@ class Benchmarker(Generic[AggregatorT, BenchmarkT, RequestT, ResponseT], ABC):
     ) -> AsyncGenerator[
         BenchmarkerResult[AggregatorT, BenchmarkT, RequestT, ResponseT], None
     ]:
-        try:
-            requests_loader_size = len(self.scheduler.request_loader)  # type: ignore[arg-type]
-        except Exception:  # noqa: BLE001
-            requests_loader_size = None
-
         strategy_limits = BenchmarkerStrategyLimits(
-            requests_loader_size=requests_loader_size,
+            requests_loader_size=self.scheduler.request_loader_length,
             max_number_per_strategy=max_number_per_strategy,
             max_duration_per_strategy=max_duration_per_strategy,
             warmup_percent_per_strategy=warmup_percent_per_strategy,
             cooldown_percent_per_strategy=cooldown_percent_per_strategy,
         )
-        start_time = time.time()
+        start_time = time.time()  # wall clock, reported with the results
         end_number = len(profile.strategy_types)
         current_index = -1
         run_id = str(uuid.uuid4())
@@ -192,51 +193,86 @@ class Benchmarker(Generic[AggregatorT, BenchmarkT, RequestT, ResponseT], ABC):
                 limits=strategy_limits,
             )
 
-            async for result in self.scheduler.run(
+            # scheduler request results are aggregated as they arrive, but updates
+            # are only yielded at most once per update interval to limit overhead
+            pending_result: Optional[SchedulerRequestResult[RequestT, ResponseT]] = None
+            last_update_time = -math.inf
+
+            scheduler_results = self.scheduler.run(
                 scheduling_strategy=scheduling_strategy,
                 max_number=max_number_per_strategy,
                 max_duration=max_duration_per_strategy,
-            ):
-                if result.type_ == "run_start":
-                    yield BenchmarkerResult(
-                        type_="scheduler_start",
-                        start_time=start_time,
-                        end_number=end_number,
-                        profile=profile,
-                        current_index=current_index,
-                        current_strategy=scheduling_strategy,
-                        current_aggregator=aggregator,
-                        current_benchmark=None,
-                        current_result=None,
-                    )
-                elif result.type_ == "run_complete":
-                    yield BenchmarkerResult(
-                        type_="scheduler_complete",
-                        start_time=start_time,
-                        end_number=end_number,
-                        profile=profile,
-                        current_index=current_index,
-                        current_strategy=scheduling_strategy,
-                        current_aggregator=aggregator,
-                        current_benchmark=None,
-                        current_result=None,
-                    )
-                elif isinstance(result, SchedulerRequestResult):
-                    aggregator.add_result(result)
-
-                    yield BenchmarkerResult(
-                        type_="scheduler_update",
-                        start_time=start_time,
-                        end_number=end_number,
-                        profile=profile,
-                        current_index=current_index,
-                        current_strategy=scheduling_strategy,
-                        current_aggregator=aggregator,
-                        current_benchmark=None,
-                        current_result=result,
-                    )
-                else:
-                    raise ValueError(f"Unexpected result type: {type(result)}")
+            )
+            try:
+                async for result in scheduler_results:
+                    if pending_result is not None and result.type_ == "run_complete":
+                        # flush the latest aggregated state before completing
+                        yield BenchmarkerResult.model_construct(
+                            type_="scheduler_update",
+                            start_time=start_time,
+                            end_number=end_number,
+                            profile=profile,
+                            current_index=current_index,
+                            current_strategy=scheduling_strategy,
+                            current_aggregator=aggregator,
+                            current_benchmark=None,
+                            current_result=pending_result,
+                        )
+                        pending_result = None
+
+                    if result.type_ == "run_start":
+                        yield BenchmarkerResult(
+                            type_="scheduler_start",
+                            start_time=start_time,
+                            end_number=end_number,
+                            profile=profile,
+                            current_index=current_index,
+                            current_strategy=scheduling_strategy,
+                            current_aggregator=aggregator,
+                            current_benchmark=None,
+                            current_result=None,
+                        )
+                    elif result.type_ == "run_complete":
+                        yield BenchmarkerResult(
+                            type_="scheduler_complete",
+                            start_time=start_time,
+                            end_number=end_number,
+                            profile=profile,
+                            current_index=current_index,
+                            current_strategy=scheduling_strategy,
+                            current_aggregator=aggregator,
+                            current_benchmark=None,
+                            current_result=None,
+                        )
+                    elif isinstance(result, SchedulerRequestResult):
+                        aggregator.add_result(result)
+
+                        if (
+                            update_time := time.monotonic()
+                        ) - last_update_time < settings.benchmark_update_interval:
+                            pending_result = result
+                            continue
+
+                        last_update_time = update_time
+                        pending_result = None
+
+                        # emitted for request events with already validated
+                        # values, so skip pydantic validation on construction
+                        yield BenchmarkerResult.model_construct(
+                            type_="scheduler_update",
+                            start_time=start_time,
+                            end_number=end_number,
+                            profile=profile,
+                            current_index=current_index,
+                            current_strategy=scheduling_strategy,
+                            current_aggregator=aggregator,
+                            current_benchmark=None,
+                            current_result=result,
+                        )
+                    else:
+                        raise ValueError(f"Unexpected result type: {type(result)}")
+            finally:
+                await scheduler_results.aclose()
 
             benchmark: BenchmarkT = aggregator.compile()
             profile.completed_strategy(
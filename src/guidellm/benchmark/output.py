@@ -1,11 +1,16 @@
 import csv
 import json
 import math
+import mmap
+import pickle
+import time
 from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal, Optional, Union
 
+import orjson
+import pydantic_core
 import yaml
 from pydantic import Field
 from rich.console import Console
@@ -28,12 +33,27 @@ from guidellm.objects import (
 from guidellm.scheduler import strategy_display_str
 from guidellm.utils import Colors, split_text_list_by_length
 
+try:
+    # libyaml bindings are significantly faster when available
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 __all__ = [
     "GenerativeBenchmarksConsole",
     "GenerativeBenchmarksReport",
 ]
 
 
+def _format_hms(timestamp: float) -> str:
+    # local HH:MM:SS from the time struct fields, without building a datetime
+    # or going through strftime for every table cell
+    local = time.localtime(timestamp)
+    return f"{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}"
+
+
 class GenerativeBenchmarksReport(StandardBaseModel):
     """
     A pydantic model representing a completed benchmark report.
@@ -54,14 +74,31 @@ class GenerativeBenchmarksReport(StandardBaseModel):
         path, type_ = GenerativeBenchmarksReport._file_setup(path)
 
         if type_ == "json":
-            with path.open("r") as file:
-                model_dict = json.load(file)
+            # parse straight from the mapped file, no copy of it into a bytes object
+            with (
+                path.open("rb") as binary_file,
+                mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                try:
+                    model_dict = orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    # orjson rejects the Infinity and NaN constants
+                    # written for non-finite metrics
+                    model_dict = pydantic_core.from_json(mapped[:])
 
             return GenerativeBenchmarksReport.model_validate(model_dict)
 
         if type_ == "yaml":
-            with path.open("r") as file:
-                model_dict = yaml.safe_load(file)
+            with path.open("r") as text_file:
+                model_dict = yaml.load(text_file, Loader=YamlLoader)  # noqa: S506
+
+            return GenerativeBenchmarksReport.model_validate(model_dict)
+
+        if type_ == "pickle":
+            # only load pickle files from trusted sources, as with any pickle
+            with path.open("rb") as binary_file:
+                model_dict = pickle.load(binary_file)  # noqa: S301
 
             return GenerativeBenchmarksReport.model_validate(model_dict)
 
@@ -114,6 +151,9 @@ class GenerativeBenchmarksReport(StandardBaseModel):
         if type_ == "csv":
             return self.save_csv(path)
 
+        if type_ == "pickle":
+            return self.save_pickle(path)
+
         raise ValueError(f"Unsupported file type: {type_} for {path}.")
 
     def save_json(self, path: Union[str, Path]) -> Path:
@@ -132,11 +172,38 @@ class GenerativeBenchmarksReport(StandardBaseModel):
                 f"Unsupported file type for saving a JSON: {type_} for {path}."
             )
 
-        model_dict = self.model_dump()
-        model_json = json.dumps(model_dict)
+        # pydantic-core encodes straight to utf-8 bytes, much faster than stdlib
+        # json, and keeps non-finite floats as Infinity and NaN like stdlib json;
+        # benchmarks are encoded one at a time so the full document is never
+        # held in memory, gathered into ~1 MB chunks so writes stay batched
+        dumps = pydantic_core.to_json
+        chunk_size = 1 << 20
+
+        with path.open("wb", buffering=chunk_size) as file:
+            chunk = bytearray(b'{"benchmarks":[')
+
+            for index, benchmark in enumerate(self.benchmarks):
+                if index:
+                    chunk += b","
+                chunk += dumps(
+                    benchmark.model_dump(mode="json"), inf_nan_mode="constants"
+                )
 
-        with path.open("w") as file:
-            file.write(model_json)
+                if len(chunk) >= chunk_size:
+                    file.write(chunk)
+                    chunk.clear()
+
+            chunk += b"]"
+
+            for key, value in self.model_dump(
+                mode="json", exclude={"benchmarks"}
+            ).items():
+                chunk += (
+                    b"," + dumps(key) + b":" + dumps(value, inf_nan_mode="constants")
+                )
+
+            chunk += b"}"
+            file.write(chunk)
 
         return path
 
@@ -157,11 +224,35 @@ class GenerativeBenchmarksReport(StandardBaseModel):
                 f"Unsupported file type for saving a YAML: {type_} for {path}."
             )
 
-        model_dict = self.model_dump()
-        model_yaml = yaml.dump(model_dict)
+        model_dict = self.model_dump(mode="json")
 
         with path.open("w") as file:
-            file.write(model_yaml)
+            yaml.dump(model_dict, file, Dumper=YamlDumper, sort_keys=False)
+
+        return path
+
+    def save_pickle(self, path: Union[str, Path]) -> Path:
+        """
+        Save the report to a binary pickle file containing all of the report data
+        which is reloadable using the pydantic model. This is the fastest format to
+        save and load for Python use; JSON and YAML remain the portable and human
+        readable formats. If the file is a directory, it will save the report to a
+        file named benchmarks.pickle under the directory.
+
+        :param path: The path to save the report to.
+        :return: The path to the saved report.
+        """
+        path, type_ = GenerativeBenchmarksReport._file_setup(path, "pickle")
+
+        if type_ != "pickle":
+            raise ValueError(
+                f"Unsupported file type for saving a pickle: {type_} for {path}."
+            )
+
+        model_dict = self.model_dump(mode="json")
+
+        with path.open("wb") as file:
+            pickle.dump(model_dict, file, protocol=pickle.HIGHEST_PROTOCOL)
 
         return path
 
@@ -182,12 +273,15 @@ class GenerativeBenchmarksReport(StandardBaseModel):
                 f"Unsupported file type for saving a CSV: {type_} for {path}."
             )
 
-        with path.open("w", newline="") as file:
+        with path.open("w", newline="", buffering=1 << 20) as file:
             writer = csv.writer(file)
-            headers: list[str] = []
-            rows: list[list[Union[str, float, list[float]]]] = []
 
-            for benchmark in self.benchmarks:
+            if not self.benchmarks:
+                writer.writerow([])
+
+            # rows are written as each benchmark is flattened rather than
+            # collected first, with a large buffer to batch the writes
+            for index, benchmark in enumerate(self.benchmarks):
                 benchmark_headers: list[str] = []
                 benchmark_values: list[Union[str, float, list[float]]] = []
 
@@ -210,21 +304,17 @@ class GenerativeBenchmarksReport(StandardBaseModel):
                 benchmark_headers += benchmark_extra_headers
                 benchmark_values += benchmark_extra_values
 
-                if not headers:
-                    headers = benchmark_headers
-                rows.append(benchmark_values)
-
-            writer.writerow(headers)
-            for row in rows:
-                writer.writerow(row)
+                if index == 0:
+                    writer.writerow(benchmark_headers)
+                writer.writerow(benchmark_values)
 
         return path
 
     @staticmethod
     def _file_setup(
         path: Union[str, Path],
-        default_file_type: Literal["json", "yaml", "csv"] = "json",
-    ) -> tuple[Path, Literal["json", "yaml", "csv"]]:
+        default_file_type: Literal["json", "yaml", "csv", "pickle"] = "json",
+    ) -> tuple[Path, Literal["json", "yaml", "csv", "pickle"]]:
         path = Path(path) if not isinstance(path, Path) else path
 
         if path.is_dir():
@@ -242,6 +332,9 @@ class GenerativeBenchmarksReport(StandardBaseModel):
         if path_suffix in [".csv"]:
             return path, "csv"
 
+        if path_suffix in [".pkl", ".pickle"]:
+            return path, "pickle"
+
         raise ValueError(f"Unsupported file extension: {path_suffix} for {path}.")
 
     @staticmethod
@@ -619,14 +712,16 @@ class GenerativeBenchmarksConsole:
         :param max_char_per_col: The maximum number of characters per column.
         :return: A list of the maximum number of characters per column.
         """
-        max_characters_per_column = []
-        for ind in range(len(headers)):
-            max_characters_per_column.append(min(len(headers[ind]), max_char_per_col))
-
-            for row in rows:
-                max_characters_per_column[ind] = max(
-                    max_characters_per_column[ind], len(str(row[ind]))
-                )
+        # walk each column once through a transpose of the rows rather than
+        # indexing into every row for every column
+        columns = list(zip(*rows)) if rows else [() for _ in headers]
+        max_characters_per_column = [
+            max(
+                min(len(header), max_char_per_col),
+                max((len(str(value)) for value in column), default=0),
+            )
+            for header, column in zip(headers, columns)
+        ]
 
         if not sections:
             return max_characters_per_column
@@ -738,24 +833,27 @@ class GenerativeBenchmarksConsole:
         Print a single row of a table to the console.
 
         :param column_lines: The lines of text to print for each column.
+        :param style: The style to apply to the column values.
         :param indent: The number of spaces to indent the line.
             Defaults to 0.
         """
+        if not self.enabled:
+            return
+
+        # build each line's text directly, the separator is shared across cells
+        # rather than rebuilding value and style lists for print_line
+        separator = settings.table_column_separator_char
+
         for row in range(len(column_lines[0])):
-            print_line = []
-            print_styles = []
-            for column in range(len(column_lines)):
-                print_line.extend(
-                    [
-                        column_lines[column][row],
-                        settings.table_column_separator_char,
-                        " ",
-                    ]
-                )
-                print_styles.extend([style, Colors.INFO, ""])
-            print_line = print_line[:-2]
-            print_styles = print_styles[:-2]
-            self.print_line(value=print_line, style=print_styles, indent=indent)
+            text = Text()
+
+            for column, lines in enumerate(column_lines):
+                if column:
+                    text.append(separator, style=Colors.INFO)
+                    text.append(" ")
+                text.append(lines[row], style=style)
+
+            self.console.print(Padding.indent(text, indent))
 
     def print_benchmarks_metadata(self):
         """
@@ -844,27 +942,30 @@ class GenerativeBenchmarksConsole:
         rows = []
 
         for benchmark in self.benchmarks:
+            totals = benchmark.request_totals
+            prompt_tokens = benchmark.metrics.prompt_token_count
+            output_tokens = benchmark.metrics.output_token_count
             rows.append(
                 [
                     strategy_display_str(benchmark.args.strategy),
-                    f"{datetime.fromtimestamp(benchmark.start_time).strftime('%H:%M:%S')}",
-                    f"{datetime.fromtimestamp(benchmark.end_time).strftime('%H:%M:%S')}",
+                    _format_hms(benchmark.start_time),
+                    _format_hms(benchmark.end_time),
                     f"{(benchmark.end_time - benchmark.start_time):.1f}",
-                    f"{benchmark.request_totals.successful:.0f}",
-                    f"{benchmark.request_totals.incomplete:.0f}",
-                    f"{benchmark.request_totals.errored:.0f}",
-                    f"{benchmark.metrics.prompt_token_count.successful.mean:.1f}",
-                    f"{benchmark.metrics.prompt_token_count.incomplete.mean:.1f}",
-                    f"{benchmark.metrics.prompt_token_count.errored.mean:.1f}",
-                    f"{benchmark.metrics.output_token_count.successful.mean:.1f}",
-                    f"{benchmark.metrics.output_token_count.incomplete.mean:.1f}",
-                    f"{benchmark.metrics.output_token_count.errored.mean:.1f}",
-                    f"{benchmark.metrics.prompt_token_count.successful.total_sum:.0f}",
-                    f"{benchmark.metrics.prompt_token_count.incomplete.total_sum:.0f}",
-                    f"{benchmark.metrics.prompt_token_count.errored.total_sum:.0f}",
-                    f"{benchmark.metrics.output_token_count.successful.total_sum:.0f}",
-                    f"{benchmark.metrics.output_token_count.incomplete.total_sum:.0f}",
-                    f"{benchmark.metrics.output_token_count.errored.total_sum:.0f}",
+                    f"{totals.successful:.0f}",
+                    f"{totals.incomplete:.0f}",
+                    f"{totals.errored:.0f}",
+                    f"{prompt_tokens.successful.mean:.1f}",
+                    f"{prompt_tokens.incomplete.mean:.1f}",
+                    f"{prompt_tokens.errored.mean:.1f}",
+                    f"{output_tokens.successful.mean:.1f}",
+                    f"{output_tokens.incomplete.mean:.1f}",
+                    f"{output_tokens.errored.mean:.1f}",
+                    f"{prompt_tokens.successful.total_sum:.0f}",
+                    f"{prompt_tokens.incomplete.total_sum:.0f}",
+                    f"{prompt_tokens.errored.total_sum:.0f}",
+                    f"{output_tokens.successful.total_sum:.0f}",
+                    f"{output_tokens.incomplete.total_sum:.0f}",
+                    f"{output_tokens.errored.total_sum:.0f}",
                 ]
             )
 
@@ -916,25 +1017,30 @@ class GenerativeBenchmarksConsole:
         rows = []
 
         for benchmark in self.benchmarks:
+            metrics = benchmark.metrics
+            request_latency = metrics.request_latency.successful
+            ttft = metrics.time_to_first_token_ms.successful
+            itl = metrics.inter_token_latency_ms.successful
+            tpot = metrics.time_per_output_token_ms.successful
             rows.append(
                 [
                     strategy_display_str(benchmark.args.strategy),
-                    f"{benchmark.metrics.requests_per_second.successful.mean:.2f}",
-                    f"{benchmark.metrics.request_concurrency.successful.mean:.2f}",
-                    f"{benchmark.metrics.output_tokens_per_second.successful.mean:.1f}",
-                    f"{benchmark.metrics.tokens_per_second.successful.mean:.1f}",
-                    f"{benchmark.metrics.request_latency.successful.mean:.2f}",
-                    f"{benchmark.metrics.request_latency.successful.median:.2f}",
-                    f"{benchmark.metrics.request_latency.successful.percentiles.p99:.2f}",
-                    f"{benchmark.metrics.time_to_first_token_ms.successful.mean:.1f}",
-                    f"{benchmark.metrics.time_to_first_token_ms.successful.median:.1f}",
-                    f"{benchmark.metrics.time_to_first_token_ms.successful.percentiles.p99:.1f}",
-                    f"{benchmark.metrics.inter_token_latency_ms.successful.mean:.1f}",
-                    f"{benchmark.metrics.inter_token_latency_ms.successful.median:.1f}",
-                    f"{benchmark.metrics.inter_token_latency_ms.successful.percentiles.p99:.1f}",
-                    f"{benchmark.metrics.time_per_output_token_ms.successful.mean:.1f}",
-                    f"{benchmark.metrics.time_per_output_token_ms.successful.median:.1f}",
-                    f"{benchmark.metrics.time_per_output_token_ms.successful.percentiles.p99:.1f}",
+                    f"{metrics.requests_per_second.successful.mean:.2f}",
+                    f"{metrics.request_concurrency.successful.mean:.2f}",
+                    f"{metrics.output_tokens_per_second.successful.mean:.1f}",
+                    f"{metrics.tokens_per_second.successful.mean:.1f}",
+                    f"{request_latency.mean:.2f}",
+                    f"{request_latency.median:.2f}",
+                    f"{request_latency.percentiles.p99:.2f}",
+                    f"{ttft.mean:.1f}",
+                    f"{ttft.median:.1f}",
+                    f"{ttft.percentiles.p99:.1f}",
+                    f"{itl.mean:.1f}",
+                    f"{itl.median:.1f}",
+                    f"{itl.percentiles.p99:.1f}",
+                    f"{tpot.mean:.1f}",
+                    f"{tpot.median:.1f}",
+                    f"{tpot.percentiles.p99:.1f}",
                 ]
             )
 
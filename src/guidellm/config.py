@@ -110,7 +110,6 @@ class Settings(BaseSettings):
 
     # general settings
     env: Environment = Environment.PROD
-    default_async_loop_sleep: float = 10e-5
     logging: LoggingSettings = LoggingSettings()
     default_sweep_number: int = 10
 
@@ -118,11 +117,23 @@ class Settings(BaseSettings):
     request_follow_redirects: bool = True
     request_timeout: int = 60 * 5  # 5 minutes
     request_http2: bool = True
+    request_http2_prior_knowledge: bool = False
+    # seconds an idle connection is kept, None keeps httpx's default (5s)
+    request_keepalive_expiry: Optional[float] = None
 
     # Scheduler settings
     max_concurrency: int = 512
     max_worker_processes: int = 10
     max_add_requests_per_loop: int = 20
+    max_results_per_loop: int = 128
+    max_result_wait: float = 0.1  # seconds idle before rechecking the run state
+    # start method for worker processes, None for the platform default (fork on
+    # Linux, spawn on macOS and Windows); set GUIDELLM__MP_CONTEXT_TYPE=forkserver
+    # to start workers from a server process with guidellm.scheduler preloaded
+    mp_context_type: Optional[Literal["fork", "forkserver", "spawn"]] = None
+
+    # Benchmarker settings
+    benchmark_update_interval: float = 0.1  # seconds between scheduler updates
 
     # Data settings
     dataset: DatasetSettings = DatasetSettings()
@@ -16,7 +16,7 @@ ColumnInputTypes = Literal[
 
 
 class DatasetCreator(ABC):
-    DEFAULT_SPLITS_TRAIN = [
+    DEFAULT_SPLITS_TRAIN = (
         "train",
         "training",
         "train_set",
@@ -30,8 +30,8 @@ class DatasetCreator(ABC):
         "pretrain_dataset",
         "pretrain_data",
         "pretraining",
-    ]
-    DEFAULT_SPLITS_CALIB = [
+    )
+    DEFAULT_SPLITS_CALIB = (
         "calibration",
         "calib",
         "cal",
@@ -40,12 +40,11 @@ class DatasetCreator(ABC):
         "cal_set",
         "calibration_dataset",
         "calib_dataset",
-        "cal_set",
         "calibration_data",
         "calib_data",
         "cal_data",
-    ]
-    DEFAULT_SPLITS_VAL = [
+    )
+    DEFAULT_SPLITS_VAL = (
         "validation",
         "val",
         "valid",
@@ -59,8 +58,8 @@ class DatasetCreator(ABC):
         "dev_set",
         "dev_dataset",
         "dev_data",
-    ]
-    DEFAULT_SPLITS_TEST = [
+    )
+    DEFAULT_SPLITS_TEST = (
         "test",
         "testing",
         "test_set",
@@ -73,7 +72,14 @@ class DatasetCreator(ABC):
         "eval_set",
         "eval_dataset",
         "eval_data",
-    ]
+    )
+    # preference order used for "auto", built once rather than per lookup
+    DEFAULT_SPLITS_AUTO = (
+        *DEFAULT_SPLITS_TEST,
+        *DEFAULT_SPLITS_VAL,
+        *DEFAULT_SPLITS_CALIB,
+        *DEFAULT_SPLITS_TRAIN,
+    )
     DEFAULT_SPLITS_DATASET: dict[str, str] = {}
 
     @classmethod
@@ -89,6 +95,9 @@ class DatasetCreator(ABC):
         if not cls.is_supported(data, data_args):
             raise ValueError(f"Unsupported data type: {type(data)} given for {data}. ")
 
+        # extracting the guidellm args pops them, copy once so the caller's
+        # dict is never mutated
+        data_args = dict(data_args) if data_args else data_args
         split = cls.extract_args_split(data_args)
         column_mappings = cls.extract_args_column_mappings(data_args)
         dataset = cls.handle_create(
@@ -107,13 +116,10 @@ class DatasetCreator(ABC):
 
     @classmethod
     def extract_args_split(cls, data_args: Optional[dict[str, Any]]) -> str:
-        split = "auto"
-
-        if data_args and "split" in data_args:
-            split = data_args["split"]
-            del data_args["split"]
+        if not data_args:
+            return "auto"
 
-        return split
+        return data_args.pop("split", "auto")
 
     @classmethod
     def extract_args_column_mappings(
@@ -123,21 +129,18 @@ class DatasetCreator(ABC):
         columns: dict[ColumnInputTypes, str] = {}
 
         if data_args:
-            if "prompt_column" in data_args:
-                columns["prompt_column"] = data_args["prompt_column"]
-                del data_args["prompt_column"]
-
-            if "prompt_tokens_count_column" in data_args:
-                columns["prompt_tokens_count_column"] = data_args[
-                    "prompt_tokens_count_column"
-                ]
-                del data_args["prompt_tokens_count_column"]
-
-            if "output_tokens_count_column" in data_args:
-                columns["output_tokens_count_column"] = data_args[
-                    "output_tokens_count_column"
-                ]
-                del data_args["output_tokens_count_column"]
+            if (column := data_args.pop("prompt_column", None)) is not None:
+                columns["prompt_column"] = column
+
+            if (
+                column := data_args.pop("prompt_tokens_count_column", None)
+            ) is not None:
+                columns["prompt_tokens_count_column"] = column
+
+            if (
+                column := data_args.pop("output_tokens_count_column", None)
+            ) is not None:
+                columns["output_tokens_count_column"] = column
 
         return columns
 
@@ -163,7 +166,9 @@ class DatasetCreator(ABC):
         cls,
         dataset: Union[DatasetDict, IterableDatasetDict],
         specified_split: Union[Literal["auto"], str] = "auto",
-        split_pref_order: Optional[Union[Literal["auto"], list[str]]] = "auto",
+        split_pref_order: Optional[
+            Union[Literal["auto"], list[str], tuple[str, ...]]
+        ] = "auto",
     ) -> Union[Dataset, IterableDataset]:
         if not isinstance(dataset, (DatasetDict, IterableDatasetDict)):
             raise ValueError(
@@ -184,12 +189,7 @@ class DatasetCreator(ABC):
             return dataset[cls.DEFAULT_SPLITS_DATASET[dataset_name]]
 
         if split_pref_order == "auto":
-            split_pref_order = [
-                *cls.DEFAULT_SPLITS_TEST,
-                *cls.DEFAULT_SPLITS_VAL,
-                *cls.DEFAULT_SPLITS_CALIB,
-                *cls.DEFAULT_SPLITS_TRAIN,
-            ]
+            split_pref_order = cls.DEFAULT_SPLITS_AUTO
 
         for test_split in split_pref_order or []:
             if test_split in dataset:
@@ -66,10 +66,8 @@ class FileDatasetCreator(DatasetCreator):
         cls, path: Path, data_args: Optional[dict[str, Any]]
     ) -> Union[Dataset, IterableDataset]:
         if path.suffix.lower() in {".txt", ".text"}:
-            with path.open("r") as file:
-                items = file.readlines()
-
-            dataset = Dataset.from_dict({"text": items}, **(data_args or {}))
+            # arrow backed line reader, avoids holding every line as a python str
+            dataset = load_dataset("text", data_files=str(path), **(data_args or {}))
         elif path.suffix.lower() == ".csv":
             dataset = load_dataset("csv", data_files=str(path), **(data_args or {}))
         elif path.suffix.lower() in {".json", ".jsonl"}:
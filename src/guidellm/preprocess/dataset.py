@@ -43,7 +43,7 @@ def handle_ignore_strategy(
     """
 
     if len(tokenizer.encode(current_prompt)) < min_prompt_tokens:
-        logger.warning("Prompt too short, ignoring")
+        # counted and logged once by the caller rather than per prompt
         return None
     return current_prompt
 
@@ -309,6 +309,7 @@ def process_dataset(
 
     dataset_iterator = iter(dataset)
     processed_prompts = []
+    ignored_count = 0
     prompt_handler = STRATEGY_HANDLERS[short_prompt_strategy]
 
     for prompt_row in dataset_iterator:
@@ -325,6 +326,7 @@ def process_dataset(
             concat_delimiter=concat_delimiter,
         )
         if prompt_text is None:
+            ignored_count += 1
             continue
 
         tokens = tokenizer.encode(prompt_text)
@@ -338,6 +340,12 @@ def process_dataset(
 
         processed_prompts.append(processed_prompt)
 
+    if ignored_count:
+        logger.warning(
+            "Ignored {} prompts that were too short for their target length",
+            ignored_count,
+        )
+
     if not processed_prompts:
         logger.error("No prompts remained after processing")
         return
@@ -4,7 +4,7 @@ from .loader import (
     RequestLoader,
     RequestLoaderDescription,
 )
-from .request import GenerationRequest
+from .request import GenerationRequest, new_request_id
 
 __all__ = [
     "GenerationRequest",
@@ -12,4 +12,5 @@ __all__ = [
     "GenerativeRequestLoaderDescription",
     "RequestLoader",
     "RequestLoaderDescription",
+    "new_request_id",
 ]
@@ -66,6 +66,7 @@ class GenerativeRequestLoader(RequestLoader):
         "turns",
         "text",
     ]
+    ITER_BATCH_SIZE = 1024
 
     def __init__(
         self,
@@ -103,7 +104,10 @@ class GenerativeRequestLoader(RequestLoader):
 
         self.column_mappings = self._create_column_mappings(args_column_mappings)
         self.preserve_iter_state = iter_type == "infinite"  # ensure no caching requests
-        self._preserved_iter = None
+        self._preserved_iter: Optional[
+            Iterator[tuple[Any, Optional[int], Optional[int]]]
+        ] = None
+        self._iter_dataset: Optional[Union[Dataset, IterableDataset]] = None
 
     def __iter__(self) -> Iterator[GenerationRequest]:
         scope_create_count = 0
@@ -111,8 +115,8 @@ class GenerativeRequestLoader(RequestLoader):
         while (dataset_iter := self._get_dataset_iter(scope_create_count)) is not None:
             scope_create_count += 1
 
-            for item in dataset_iter:
-                yield self._create_request(item)
+            for prompt, prompt_tokens, output_tokens in dataset_iter:
+                yield self._create_request(prompt, prompt_tokens, output_tokens)
 
             self._preserved_iter = None
 
@@ -240,41 +244,62 @@ class GenerativeRequestLoader(RequestLoader):
 
     def _get_dataset_iter(
         self, scope_create_count: int
-    ) -> Optional[Iterator[dict[str, Any]]]:
+    ) -> Optional[Iterator[tuple[Any, Optional[int], Optional[int]]]]:
         if scope_create_count > 0 and self.iter_type != "infinite":
             return None
 
         if self.preserve_iter_state and self._preserved_iter is not None:
             return self._preserved_iter
 
-        dataset = (
-            self.dataset
-            if not self.shuffle
-            else self.dataset.shuffle(seed=self.random_seed)
-        )
+        if self._iter_dataset is None:
+            # only the mapped columns are read, so narrow the dataset to them
+            # and iteration never decodes the others into python objects
+            dataset = self.dataset.select_columns(
+                list(dict.fromkeys(self.column_mappings.values()))
+            )
+            # shuffling with a fixed seed always gives the same order, so build
+            # the shuffled dataset once instead of on every pass over the data
+            self._iter_dataset = (
+                dataset if not self.shuffle else dataset.shuffle(seed=self.random_seed)
+            )
 
-        dataset_iter = iter(dataset)
+        dataset_iter = self._iter_dataset_columns(self._iter_dataset)
 
         if self.preserve_iter_state:
             self._preserved_iter = dataset_iter
 
         return dataset_iter
 
-    def _create_request(self, item: dict[str, Any]) -> GenerationRequest:
-        prompt_tokens = (
-            item[self.column_mappings["prompt_tokens_count_column"]]
-            if "prompt_tokens_count_column" in self.column_mappings
-            else None
-        )
-        output_tokens = (
-            item[self.column_mappings["output_tokens_count_column"]]
-            if "output_tokens_count_column" in self.column_mappings
-            else None
-        )
+    def _iter_dataset_columns(
+        self,
+        dataset: Union[Dataset, IterableDataset],
+    ) -> Iterator[tuple[Any, Optional[int], Optional[int]]]:
+        # read the mapped columns in batches as column lists rather than
+        # building a dict of every column for each row
+        prompt_column = self.column_mappings["prompt_column"]
+        prompt_tokens_column = self.column_mappings.get("prompt_tokens_count_column")
+        output_tokens_column = self.column_mappings.get("output_tokens_count_column")
+
+        for batch in dataset.iter(batch_size=self.ITER_BATCH_SIZE):
+            prompts = batch[prompt_column]
+            nones = [None] * len(prompts)
+            yield from zip(
+                prompts,
+                batch[prompt_tokens_column] if prompt_tokens_column else nones,
+                batch[output_tokens_column] if output_tokens_column else nones,
+            )
 
-        return GenerationRequest(
+    def _create_request(
+        self,
+        prompt: Any,
+        prompt_tokens: Optional[int],
+        output_tokens: Optional[int],
+    ) -> GenerationRequest:
+        # created for every request sent, from values already typed by the
+        # dataset, skip pydantic validation and the init debug log
+        return GenerationRequest.model_construct(
             request_type=settings.preferred_route,
-            content=item[self.column_mappings["prompt_column"]],
+            content=prompt,
             stats=(
                 {"prompt_tokens": prompt_tokens} if prompt_tokens is not None else {}
             ),
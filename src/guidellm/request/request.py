@@ -1,3 +1,5 @@
+import itertools
+import os
 import uuid
 from typing import Any, Literal, Optional
 
@@ -5,7 +7,32 @@ from pydantic import Field
 
 from guidellm.objects.pydantic import StandardBaseModel
 
-__all__ = ["GenerationRequest"]
+__all__ = ["GenerationRequest", "new_request_id"]
+
+_request_id_base = uuid.uuid4().hex
+_request_id_counter = itertools.count()
+
+
+def _reset_request_ids():
+    global _request_id_base, _request_id_counter  # noqa: PLW0603
+    _request_id_base = uuid.uuid4().hex
+    _request_id_counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    # forked processes must not continue the parent's id sequence
+    os.register_at_fork(after_in_child=_reset_request_ids)
+
+
+def new_request_id() -> str:
+    """
+    Generate a unique identifier for a request.
+    Ids are a random base, generated once per process, followed by an
+    incrementing counter so no random source is read per request.
+
+    :return: The unique identifier as a string.
+    """
+    return f"{_request_id_base}-{next(_request_id_counter):x}"
 
 
 class GenerationRequest(StandardBaseModel):
@@ -34,7 +61,7 @@ class GenerationRequest(StandardBaseModel):
     """
 
     request_id: Optional[str] = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=new_request_id,
         description="The unique identifier for the request.",
     )
     request_type: Literal["text_completions", "chat_completions"] = Field(
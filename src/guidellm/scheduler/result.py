@@ -1,9 +1,12 @@
+from dataclasses import dataclass
 from typing import (
     Generic,
     Literal,
     Optional,
 )
 
+from pydantic import ConfigDict
+
 from guidellm.objects import StandardBaseModel
 from guidellm.scheduler.strategy import SchedulingStrategy
 from guidellm.scheduler.types import RequestT, ResponseT
@@ -41,6 +44,9 @@ class SchedulerRunInfo(StandardBaseModel):
     :param completed_requests: The number of requests completed during the run.
     """
 
+    # counters are updated by the scheduler on every request event
+    model_config = ConfigDict(validate_assignment=False)
+
     start_time: float
     end_time: float
     end_number: float
@@ -54,12 +60,16 @@ class SchedulerRunInfo(StandardBaseModel):
     completed_requests: int = 0
 
 
-class SchedulerRequestInfo(StandardBaseModel):
+@dataclass
+class SchedulerRequestInfo:
     """
     Information about a specific request run through the scheduler.
     This class holds metadata about the request, including
     the targeted start time, queued time, start time, end time,
     and the process ID that handled the request.
+    It is a plain dataclass rather than a pydantic model since it is
+    updated and sent between processes for every request,
+    pydantic still validates and serializes it within the benchmark reports.
 
     :param targeted_start_time: The targeted start time for the request (time.time()).
     :param queued_time: The time the request was queued (time.time()).
@@ -1,9 +1,9 @@
 import asyncio
+import contextlib
 import math
 import multiprocessing
-import multiprocessing.queues
 import time
-from collections.abc import AsyncGenerator, Iterable, Iterator
+from collections.abc import AsyncGenerator, Callable, Iterable, Iterator
 from concurrent.futures import ProcessPoolExecutor
 from typing import (
     Any,
@@ -31,6 +31,45 @@ from guidellm.scheduler.worker import (
 __all__ = ["Scheduler"]
 
 
+_process_queues: Optional[tuple[multiprocessing.Queue, multiprocessing.Queue]] = None
+_process_ready: Optional[Any] = None
+
+
+def _set_process_queues(
+    requests_queue: multiprocessing.Queue,
+    responses_queue: multiprocessing.Queue,
+    ready: Any,
+):
+    # multiprocessing queues can only be shared through inheritance,
+    # so they are handed to each worker process by the executor initializer
+    global _process_queues, _process_ready  # noqa: PLW0603
+    _process_queues = (requests_queue, responses_queue)
+    _process_ready = ready
+
+
+def _run_process_loop(process_loop: Callable[..., None], *args: Any):
+    requests_queue, responses_queue = _process_queues  # type: ignore[misc]
+    _process_ready.release()  # type: ignore[union-attr]
+    process_loop(requests_queue, responses_queue, *args)
+
+
+def _get_mp_context():
+    context_type = settings.mp_context_type
+
+    if context_type is not None and (
+        context_type not in multiprocessing.get_all_start_methods()
+    ):
+        context_type = None
+
+    context = multiprocessing.get_context(context_type)
+
+    if context_type == "forkserver":
+        # imported once in the server rather than by every worker process
+        context.set_forkserver_preload(["guidellm.scheduler"])
+
+    return context
+
+
 class Scheduler(Generic[RequestT, ResponseT]):
     """
     A class that handles the scheduling of requests to a worker.
@@ -64,6 +103,12 @@ class Scheduler(Generic[RequestT, ResponseT]):
 
         self.worker = worker
         self.request_loader = request_loader
+        self.request_loader_length: Optional[int] = None
+
+        # resolved once rather than for every run, the loader may be unsized
+        # or raise ValueError when its length can't be determined (infinite data)
+        with contextlib.suppress(TypeError, ValueError):
+            self.request_loader_length = len(request_loader)  # type: ignore[arg-type]
 
     async def run(
         self,
@@ -113,15 +158,33 @@ class Scheduler(Generic[RequestT, ResponseT]):
         if max_duration is not None and max_duration < 0:
             raise ValueError(f"Invalid max_duration: {max_duration}")
 
-        with (
-            multiprocessing.Manager() as manager,
-            ProcessPoolExecutor(
-                max_workers=scheduling_strategy.processes_limit
-            ) as executor,
-        ):
+        # direct queues rather than manager proxies, avoiding a round trip
+        # through the manager process for every put and get
+        mp_context = _get_mp_context()
+        requests_queue: multiprocessing.Queue = mp_context.Queue(
+            maxsize=scheduling_strategy.queued_requests_limit or 0
+        )
+        responses_queue: multiprocessing.Queue = mp_context.Queue()
+        processes_ready = mp_context.Semaphore(0)
+
+        with ProcessPoolExecutor(
+            max_workers=scheduling_strategy.processes_limit,
+            mp_context=mp_context,
+            initializer=_set_process_queues,
+            initargs=(requests_queue, responses_queue, processes_ready),
+        ) as executor:
             requests_iter: Optional[Iterator[Any]] = None
-            futures, requests_queue, responses_queue = await self._start_processes(
-                manager, executor, scheduling_strategy
+            futures = await self._start_processes(
+                executor, scheduling_strategy, processes_ready
+            )
+            # responses are received by a blocking thread and handed to the loop,
+            # so results wake the run immediately rather than through polling
+            responses_bridge: asyncio.Queue[
+                WorkerProcessResult[RequestT, ResponseT]
+            ] = asyncio.Queue()
+            loop = asyncio.get_running_loop()
+            responses_drain = loop.run_in_executor(
+                None, self._drain_responses, responses_queue, responses_bridge, loop
             )
             run_info, requests_iter, times_iter = self._run_setup(
                 futures, scheduling_strategy, max_number, max_duration
@@ -133,10 +196,7 @@ class Scheduler(Generic[RequestT, ResponseT]):
 
             try:
                 while True:
-                    # check errors and raise them
-                    for future in futures:
-                        if future.done() and (err := future.exception()) is not None:
-                            raise err
+                    self._check_processes(futures)
 
                     if (
                         requests_iter is None
@@ -146,24 +206,17 @@ class Scheduler(Generic[RequestT, ResponseT]):
                         # and yielded all responses
                         break
 
-                    requests_iter = self._add_requests(
-                        requests_iter,
-                        times_iter,
-                        requests_queue,
-                        run_info,
+                    requests_iter, wait = await self._schedule_requests(
+                        requests_iter, times_iter, requests_queue, run_info
                     )
-                    await asyncio.sleep(0)  # enable requests to start
 
-                    iter_result = self._check_result_ready(
-                        responses_queue,
-                        run_info,
-                    )
-                    if iter_result is not None:
+                    # yield all results that are ready before adding more requests
+                    async for iter_result in self._ready_results(
+                        responses_bridge, run_info, wait
+                    ):
                         yield iter_result
-
-                    # yield control to the event loop
-                    await asyncio.sleep(settings.default_async_loop_sleep)
             except Exception as err:
+                responses_queue.put(None)  # release the drain thread
                 raise RuntimeError(f"Scheduler run failed: {err}") from err
 
             yield SchedulerResult(
@@ -171,23 +224,17 @@ class Scheduler(Generic[RequestT, ResponseT]):
                 run_info=run_info,
             )
 
-            await self._stop_processes(futures, requests_queue)
+            await self._stop_processes(
+                futures, requests_queue, responses_queue, responses_drain
+            )
 
     async def _start_processes(
         self,
-        manager,
         executor: ProcessPoolExecutor,
         scheduling_strategy: SchedulingStrategy,
-    ) -> tuple[
-        list[asyncio.Future],
-        multiprocessing.Queue,
-        multiprocessing.Queue,
-    ]:
+        processes_ready: Any,
+    ) -> list[asyncio.Future]:
         await self.worker.prepare_multiprocessing()
-        requests_queue = manager.Queue(
-            maxsize=scheduling_strategy.queued_requests_limit
-        )
-        responses_queue = manager.Queue()
 
         num_processes = min(
             scheduling_strategy.processes_limit,
@@ -216,9 +263,8 @@ class Scheduler(Generic[RequestT, ResponseT]):
                 futures.append(
                     loop.run_in_executor(
                         executor,
+                        _run_process_loop,
                         self.worker.process_loop_synchronous,
-                        requests_queue,
-                        responses_queue,
                         id_,
                     )
                 )
@@ -226,9 +272,8 @@ class Scheduler(Generic[RequestT, ResponseT]):
                 futures.append(
                     loop.run_in_executor(
                         executor,
+                        _run_process_loop,
                         self.worker.process_loop_asynchronous,
-                        requests_queue,
-                        responses_queue,
                         requests_limit,
                         id_,
                     )
@@ -239,9 +284,14 @@ class Scheduler(Generic[RequestT, ResponseT]):
                     f"for strategy: {scheduling_strategy}"
                 )
 
-        await asyncio.sleep(0.1)  # give time for processes to start
+        # wait for each process to pick up its loop rather than a fixed delay
+        for _ in futures:
+            while not await asyncio.to_thread(
+                processes_ready.acquire, True, settings.max_result_wait
+            ):
+                self._check_processes(futures)
 
-        return futures, requests_queue, responses_queue
+        return futures
 
     def _run_setup(
         self,
@@ -253,16 +303,15 @@ class Scheduler(Generic[RequestT, ResponseT]):
         requests_iter = iter(self.request_loader)
         start_time = time.time()
         times_iter = iter(scheduling_strategy.request_times())
-        end_time = time.time() + (max_duration or math.inf)
+        end_time = start_time + (max_duration or math.inf)
         end_number = max_number or math.inf
 
-        try:
-            # update end number if the request loader is finite and less than max
-            iter_length = len(self.request_loader)  # type: ignore[arg-type]
-            if 0 < iter_length < end_number:
-                end_number = iter_length
-        except Exception:  # noqa: BLE001, S110
-            pass
+        # update end number if the request loader is finite and less than max
+        if (
+            self.request_loader_length is not None
+            and 0 < self.request_loader_length < end_number
+        ):
+            end_number = self.request_loader_length
 
         if end_number == math.inf and end_time is None:
             logger.warning(
@@ -280,6 +329,35 @@ class Scheduler(Generic[RequestT, ResponseT]):
 
         return info, requests_iter, times_iter
 
+    @staticmethod
+    def _check_processes(futures: list[asyncio.Future]):
+        # raise the first error from any worker process that has failed
+        for future in futures:
+            if future.done() and (err := future.exception()) is not None:
+                raise err
+
+    async def _schedule_requests(
+        self,
+        requests_iter: Optional[Iterator[Any]],
+        times_iter: Iterator[float],
+        requests_queue: multiprocessing.Queue,
+        run_info: SchedulerRunInfo,
+    ) -> tuple[Optional[Iterator[Any]], bool]:
+        created_requests = run_info.created_requests
+        requests_iter = self._add_requests(
+            requests_iter, times_iter, requests_queue, run_info
+        )
+
+        if run_info.created_requests > created_requests:
+            # let handed over results in before checking them,
+            # otherwise the result wait below yields to the loop
+            await asyncio.sleep(0)
+
+        # only wait on results if no more requests can be added
+        wait = requests_iter is None or self._requests_queue_full(run_info)
+
+        return requests_iter, wait
+
     def _add_requests(
         self,
         requests_iter: Optional[Iterator[Any]],
@@ -290,9 +368,11 @@ class Scheduler(Generic[RequestT, ResponseT]):
         if requests_iter is not None:
             try:
                 added_count = 0
+                # read the clock once per call, requests are added back to back
+                now = time.time()
 
                 while (
-                    not requests_queue.full()
+                    not self._requests_queue_full(run_info)
                     and added_count < settings.max_add_requests_per_loop
                 ):
                     if run_info.created_requests >= run_info.end_number:
@@ -300,7 +380,7 @@ class Scheduler(Generic[RequestT, ResponseT]):
 
                     if (
                         request_time := next(times_iter)
-                    ) >= run_info.end_time or time.time() >= run_info.end_time:
+                    ) >= run_info.end_time or now >= run_info.end_time:
                         raise StopIteration
 
                     request = next(requests_iter)
@@ -308,7 +388,7 @@ class Scheduler(Generic[RequestT, ResponseT]):
                         request=request,
                         start_time=request_time,
                         timeout_time=run_info.end_time,
-                        queued_time=time.time(),
+                        queued_time=now,
                     )
                     requests_queue.put(work_req)
 
@@ -322,23 +402,78 @@ class Scheduler(Generic[RequestT, ResponseT]):
 
         return requests_iter
 
-    def _check_result_ready(
-        self,
+    @staticmethod
+    def _requests_queue_full(run_info: SchedulerRunInfo) -> bool:
+        # tracked locally instead of querying the queue, queued_requests only
+        # drops once a worker reports the request, so it never undercounts
+        limit = run_info.strategy.queued_requests_limit
+
+        return limit is not None and run_info.queued_requests >= limit
+
+    @staticmethod
+    def _drain_responses(
         responses_queue: multiprocessing.Queue,
+        responses_bridge: asyncio.Queue,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        # runs in a thread, blocking on the process queue until the None sentinel
+        def _put_all(process_responses: list[WorkerProcessResult]):
+            for process_response in process_responses:
+                responses_bridge.put_nowait(process_response)
+
+        try:
+            # workers send their results in batches, one loop callback per batch
+            while (process_responses := responses_queue.get()) is not None:
+                loop.call_soon_threadsafe(_put_all, process_responses)
+        except (EOFError, OSError):
+            # queue closed after a failed run, nothing left to drain
+            pass
+
+    async def _ready_results(
+        self,
+        responses_bridge: asyncio.Queue,
+        run_info: SchedulerRunInfo,
+        wait: bool,
+    ) -> AsyncGenerator[SchedulerRequestResult[RequestT, ResponseT], None]:
+        # bounded per loop so new requests are still added at their start times,
+        # waiting only on the first result when requested
+        for index in range(settings.max_results_per_loop):
+            result = await self._check_result_ready(
+                responses_bridge, run_info, wait=wait and index == 0
+            )
+            if result is None:
+                break
+
+            yield result
+
+    async def _check_result_ready(
+        self,
+        responses_bridge: asyncio.Queue,
         run_info: SchedulerRunInfo,
+        wait: bool,
     ) -> Optional[SchedulerRequestResult[RequestT, ResponseT]]:
         try:
             process_response: WorkerProcessResult[RequestT, ResponseT] = (
-                responses_queue.get_nowait()
+                responses_bridge.get_nowait()
             )
-        except multiprocessing.queues.Empty:  # type: ignore[attr-defined]
-            return None
+        except asyncio.QueueEmpty:
+            if not wait:
+                return None
 
+            try:
+                # bounded so worker errors and the end time are still rechecked
+                process_response = await asyncio.wait_for(
+                    responses_bridge.get(), timeout=settings.max_result_wait
+                )
+            except asyncio.TimeoutError:
+                return None
+
+        # the worker results are already typed, so validation is skipped
         if process_response.type_ == "request_scheduled":
             run_info.queued_requests -= 1
             run_info.scheduled_requests += 1
 
-            return SchedulerRequestResult(
+            return SchedulerRequestResult.model_construct(
                 type_="request_scheduled",
                 run_info=run_info,
                 request=process_response.request,
@@ -350,7 +485,7 @@ class Scheduler(Generic[RequestT, ResponseT]):
             run_info.scheduled_requests -= 1
             run_info.processing_requests += 1
 
-            return SchedulerRequestResult(
+            return SchedulerRequestResult.model_construct(
                 type_="request_start",
                 run_info=run_info,
                 request=process_response.request,
@@ -362,7 +497,7 @@ class Scheduler(Generic[RequestT, ResponseT]):
             run_info.processing_requests -= 1
             run_info.completed_requests += 1
 
-            return SchedulerRequestResult(
+            return SchedulerRequestResult.model_construct(
                 type_="request_complete",
                 run_info=run_info,
                 request=process_response.request,
@@ -375,8 +510,13 @@ class Scheduler(Generic[RequestT, ResponseT]):
         self,
         futures: list[asyncio.Future],
         requests_queue: multiprocessing.Queue,
+        responses_queue: multiprocessing.Queue,
+        responses_drain: asyncio.Future,
     ):
         for _ in futures:
             requests_queue.put(None)
 
         await asyncio.gather(*futures)
+
+        responses_queue.put(None)
+        await responses_drain
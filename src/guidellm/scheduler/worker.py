@@ -82,6 +82,9 @@ class RequestsWorker(ABC, Generic[RequestT, ResponseT]):
     The `resolve` method should return the response from the backend.
     """
 
+    _pending_results: list[WorkerProcessResult[RequestT, ResponseT]]
+    _sending_results: bool
+
     @property
     @abstractmethod
     def description(self) -> WorkerDescription:
@@ -102,6 +105,14 @@ class RequestsWorker(ABC, Generic[RequestT, ResponseT]):
         """
         ...
 
+    async def close(self):
+        """
+        Release any resources, such as open connections, held by the worker.
+        Called within the worker process's event loop once its processing
+        loop exits.
+        """
+        return
+
     @abstractmethod
     async def resolve(
         self,
@@ -130,7 +141,25 @@ class RequestsWorker(ABC, Generic[RequestT, ResponseT]):
         results_queue: multiprocessing.Queue,
         result: WorkerProcessResult[RequestT, ResponseT],
     ):
-        await asyncio.to_thread(results_queue.put, result)  # type: ignore[attr-defined]
+        if not hasattr(self, "_pending_results"):
+            # created lazily, subclasses are not required to call super().__init__()
+            self._pending_results = []
+            self._sending_results = False
+
+        # results sent while a put is in flight are gathered into a single put,
+        # amortizing the queue round trip and keeping results in the order sent
+        self._pending_results.append(result)
+
+        if self._sending_results:
+            return
+
+        self._sending_results = True
+        try:
+            while self._pending_results:
+                results, self._pending_results = self._pending_results, []
+                await asyncio.to_thread(results_queue.put, results)  # type: ignore[attr-defined]
+        finally:
+            self._sending_results = False
 
     async def resolve_scheduler_request(
         self,
@@ -142,11 +171,12 @@ class RequestsWorker(ABC, Generic[RequestT, ResponseT]):
         results_queue: multiprocessing.Queue,
         process_id: int,
     ):
+        scheduled_time = time.time()
         info = SchedulerRequestInfo(
             targeted_start_time=start_time,
             queued_time=queued_time,
             dequeued_time=dequeued_time,
-            scheduled_time=time.time(),
+            scheduled_time=scheduled_time,
             process_id=process_id,
         )
         result: WorkerProcessResult[RequestT, ResponseT] = WorkerProcessResult(
@@ -157,10 +187,13 @@ class RequestsWorker(ABC, Generic[RequestT, ResponseT]):
         )
         asyncio.create_task(self.send_result(results_queue, result))
 
-        if (wait_time := start_time - time.time()) > 0:
+        if (wait_time := start_time - scheduled_time) > 0:
             await asyncio.sleep(wait_time)
+            info.worker_start = time.time()
+        else:
+            # no wait, so the scheduled time read above is still current
+            info.worker_start = scheduled_time
 
-        info.worker_start = time.time()
         result = WorkerProcessResult(
             type_="request_start",
             request=request,
@@ -192,20 +225,23 @@ class RequestsWorker(ABC, Generic[RequestT, ResponseT]):
         process_id: int,
     ):
         async def _process_runner():
-            while (
-                process_request := await self.get_request(requests_queue)
-            ) is not None:
-                dequeued_time = time.time()
-
-                await self.resolve_scheduler_request(
-                    request=process_request.request,
-                    queued_time=process_request.queued_time,
-                    dequeued_time=dequeued_time,
-                    start_time=process_request.start_time,
-                    timeout_time=process_request.timeout_time,
-                    results_queue=results_queue,
-                    process_id=process_id,
-                )
+            try:
+                while (
+                    process_request := await self.get_request(requests_queue)
+                ) is not None:
+                    dequeued_time = time.time()
+
+                    await self.resolve_scheduler_request(
+                        request=process_request.request,
+                        queued_time=process_request.queued_time,
+                        dequeued_time=dequeued_time,
+                        start_time=process_request.start_time,
+                        timeout_time=process_request.timeout_time,
+                        results_queue=results_queue,
+                        process_id=process_id,
+                    )
+            finally:
+                await self.close()
 
         try:
             asyncio.run(_process_runner())
@@ -229,19 +265,11 @@ class RequestsWorker(ABC, Generic[RequestT, ResponseT]):
             if pending.locked():
                 raise ValueError("Async worker called with max_concurrency < 1")
 
-            while (
-                process_request := await self.get_request(requests_queue)
-            ) is not None:
-                dequeued_time = time.time()
-
-                await pending.acquire()
-
-                def _task_done(_: asyncio.Task):
-                    nonlocal pending
-                    pending.release()
-
-                task = asyncio.create_task(
-                    self.resolve_scheduler_request(
+            async def _resolve_and_release(
+                process_request: WorkerProcessRequest[RequestT], dequeued_time: float
+            ):
+                try:
+                    await self.resolve_scheduler_request(
                         request=process_request.request,
                         queued_time=process_request.queued_time,
                         dequeued_time=dequeued_time,
@@ -250,9 +278,22 @@ class RequestsWorker(ABC, Generic[RequestT, ResponseT]):
                         results_queue=results_queue,
                         process_id=process_id,
                     )
-                )
-                task.add_done_callback(_task_done)
-                await asyncio.sleep(0)  # enable start task immediately
+                finally:
+                    pending.release()
+
+            try:
+                while (
+                    process_request := await self.get_request(requests_queue)
+                ) is not None:
+                    dequeued_time = time.time()
+
+                    await pending.acquire()
+                    # the task starts while the next get_request awaits its thread
+                    asyncio.create_task(
+                        _resolve_and_release(process_request, dequeued_time)
+                    )
+            finally:
+                await self.close()
 
         try:
             asyncio.run(_process_runner())
@@ -315,7 +356,7 @@ class GenerativeRequestsWorker(RequestsWorker[GenerationRequest, ResponseSummary
         results_queue: multiprocessing.Queue,
         process_id: int,
     ):
-        asyncio.run(self.backend.validate())
+        asyncio.run(self._validate_backend())
         super().process_loop_synchronous(
             requests_queue=requests_queue,
             results_queue=results_queue,
@@ -329,7 +370,7 @@ class GenerativeRequestsWorker(RequestsWorker[GenerationRequest, ResponseSummary
         max_concurrency: int,
         process_id: int,
     ):
-        asyncio.run(self.backend.validate())
+        asyncio.run(self._validate_backend())
         super().process_loop_asynchronous(
             requests_queue=requests_queue,
             results_queue=results_queue,
@@ -337,6 +378,18 @@ class GenerativeRequestsWorker(RequestsWorker[GenerationRequest, ResponseSummary
             process_id=process_id,
         )
 
+    async def close(self):
+        """
+        Close the backend's connections once the processing loop exits.
+        """
+        await self.backend.close()
+
+    async def _validate_backend(self):
+        # validation runs in its own event loop, close any connections it opened
+        # so the processing loop does not reuse connections bound to a closed loop
+        await self.backend.validate()
+        await self.backend.close()
+
     async def resolve(
         self,
         request: GenerationRequest,
@@ -355,6 +408,7 @@ class GenerativeRequestsWorker(RequestsWorker[GenerationRequest, ResponseSummary
         """
         resolve_start_time = time.time()
         response = None
+        response_deltas: list[str] = []
         error: Optional[str] = None
         status = ResolveStatus(
             requested=False,
@@ -366,7 +420,7 @@ class GenerativeRequestsWorker(RequestsWorker[GenerationRequest, ResponseSummary
         )
 
         try:
-            if timeout_time < time.time():
+            if timeout_time < resolve_start_time:
                 raise asyncio.TimeoutError(
                     "The timeout time has already passed."
                 )  # exit early
@@ -381,6 +435,10 @@ class GenerativeRequestsWorker(RequestsWorker[GenerationRequest, ResponseSummary
                     nonlocal response
                     response = resp
 
+                    if isinstance(resp, StreamingTextResponse):
+                        # joined only if the request times out mid stream
+                        response_deltas.append(resp.delta)
+
             await asyncio.wait_for(
                 _runner(),
                 timeout=timeout_time - time.time() if timeout_time < math.inf else None,
@@ -412,6 +470,7 @@ class GenerativeRequestsWorker(RequestsWorker[GenerationRequest, ResponseSummary
             response=response,
             error=error,
             resolve_start_time=resolve_start_time,
+            response_deltas=response_deltas,
         )
 
     def _create_request_func_kwargs(
@@ -458,6 +517,7 @@ class GenerativeRequestsWorker(RequestsWorker[GenerationRequest, ResponseSummary
         response: Any,
         error: Optional[str],
         resolve_start_time: float,
+        response_deltas: Optional[list[str]] = None,
     ) -> tuple[ResolveStatus, ResponseSummary]:
         if response is None or not isinstance(
             response, (ResponseSummary, StreamingTextResponse)
@@ -487,7 +547,7 @@ class GenerativeRequestsWorker(RequestsWorker[GenerationRequest, ResponseSummary
             )
         elif isinstance(response, StreamingTextResponse):
             response = ResponseSummary(
-                value=response.value,
+                value=response.value or "".join(response_deltas or []),
                 request_args=RequestArgs(
                     target=self.backend.target,
                     headers={},
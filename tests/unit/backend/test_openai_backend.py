@@ -1,6 +1,9 @@
+import json
 import time
 
+import httpx
 import pytest
+import respx
 
 from guidellm.backend import OpenAIHTTPBackend, ResponseSummary, StreamingTextResponse
 from guidellm.config import settings
@@ -16,6 +19,7 @@ def test_openai_http_backend_default_initialization():
     assert backend.project == settings.openai.project
     assert backend.timeout == settings.request_timeout
     assert backend.http2 is True
+    assert backend.http2_prior_knowledge is False
     assert backend.follow_redirects is True
     assert backend.max_output_tokens == settings.openai.max_output_tokens
     assert backend.extra_query is None
@@ -31,6 +35,7 @@ def test_openai_http_backend_intialization():
         project="test-proj",
         timeout=10,
         http2=False,
+        http2_prior_knowledge=True,
         follow_redirects=False,
         max_output_tokens=100,
         extra_query={"foo": "bar"},
@@ -42,6 +47,7 @@ def test_openai_http_backend_intialization():
     assert backend.project == "test-proj"
     assert backend.timeout == 10
     assert backend.http2 is False
+    assert backend.http2_prior_knowledge is True
     assert backend.follow_redirects is False
     assert backend.max_output_tokens == 100
     assert backend.extra_query == {"foo": "bar"}
@@ -205,3 +211,110 @@ async def test_openai_http_backend_chat_completions_counts(httpx_openai_mock):
     assert final_resp.response_prompt_tokens == 3
     assert final_resp.response_output_tokens == 10
     assert final_resp.request_id == "test-id"
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_openai_http_backend_client_reuse(httpx_openai_mock):
+    backend = OpenAIHTTPBackend(target="http://target.mock", model="mock-model")
+    client = backend._get_async_client()
+    assert backend._get_async_client() is client
+
+    async for _ in backend.text_completions("Test Prompt", request_id="test-id"):
+        pass
+
+    assert backend._get_async_client() is client
+
+    await backend.close()
+    assert backend._async_client is None
+    assert backend._get_async_client() is not client
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_openai_http_backend_extra_body_unchanged(httpx_openai_mock):
+    extra_body = {"temperature": 0.5}
+    backend = OpenAIHTTPBackend(
+        target="http://target.mock",
+        model="mock-model",
+        max_output_tokens=100,
+        extra_body=extra_body,
+    )
+
+    for _ in range(2):
+        async for _ in backend.text_completions(
+            "Test Prompt", request_id="test-id", output_token_count=10
+        ):
+            pass
+
+    assert extra_body == {"temperature": 0.5}
+    assert backend._headers() is backend._headers()
+
+
+@pytest.mark.sanity
+@pytest.mark.asyncio
+async def test_openai_http_backend_split_stream_events():
+    lines = [
+        f"data: {json.dumps({'choices': [{'text': token}]})}\n\n"
+        for token in ("Hello", " world", "!")
+    ]
+    # usage event split across multiple data lines
+    lines.extend(
+        (
+            'data: {"usage": {"prompt_tokens": 2,\n',
+            'data: "completion_tokens": 3}}\n\n',
+        )
+    )
+    lines.append("data: [DONE]\n\n")
+    raw = "".join(lines).encode()
+
+    class _SplitStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            # deliver the body in small chunks that split events mid-line
+            for index in range(0, len(raw), 7):
+                yield raw[index : index + 7]
+
+    with respx.mock(assert_all_mocked=True) as mock_router:
+        mock_router.route(method="POST", path="/v1/completions").mock(
+            return_value=httpx.Response(200, stream=_SplitStream())
+        )
+        backend = OpenAIHTTPBackend(target="http://target.mock", model="mock-model")
+        responses = [
+            resp async for resp in backend.text_completions("Test", request_id="id")
+        ]
+
+    final_resp = responses[-1]
+    assert isinstance(final_resp, ResponseSummary)
+    assert final_resp.value == "Hello world!"
+    assert final_resp.iterations == 3
+    assert final_resp.response_prompt_tokens == 2
+    assert final_resp.response_output_tokens == 3
+
+
+@pytest.mark.sanity
+@pytest.mark.asyncio
+async def test_openai_http_backend_unterminated_final_event():
+    lines = [
+        f"data: {json.dumps({'choices': [{'text': token}]})}\n\n"
+        for token in ("Hello", " world")
+    ]
+    # final event without a trailing newline or a [DONE] marker
+    lines.append('data: {"choices": [{"text": "!"}], "usage": {"prompt_tokens": 2, ')
+    lines.append('"completion_tokens": 3}}')
+    raw = "".join(lines).encode()
+
+    with respx.mock(assert_all_mocked=True) as mock_router:
+        mock_router.route(method="POST", path="/v1/completions").mock(
+            return_value=httpx.Response(200, content=raw)
+        )
+        backend = OpenAIHTTPBackend(target="http://target.mock", model="mock-model")
+        responses = [
+            resp async for resp in backend.text_completions("Test", request_id="id")
+        ]
+
+    final_resp = responses[-1]
+    assert isinstance(final_resp, ResponseSummary)
+    assert final_resp.value == "Hello world!"
+    assert final_resp.iterations == 3
+    assert final_resp.response_prompt_tokens == 2
+    assert final_resp.response_output_tokens == 3
@@ -1,5 +1,6 @@
 import csv
 import json
+import math
 from pathlib import Path
 from unittest.mock import patch
 
@@ -61,6 +62,29 @@ def test_file_json():
     mock_path.unlink()
 
 
+def test_file_json_non_finite():
+    mock_benchmark = mock_generative_benchmark()
+    mock_benchmark.metrics.requests_per_second.successful.mean = math.inf
+    mock_benchmark.metrics.requests_per_second.successful.median = math.nan
+    report = GenerativeBenchmarksReport(benchmarks=[mock_benchmark])
+
+    mock_path = Path("mock_report.json")
+    report.save_file(mock_path)
+
+    with mock_path.open("r") as file:
+        saved_data = json.load(file)
+    saved_rps = saved_data["benchmarks"][0]["metrics"]["requests_per_second"]
+    assert saved_rps["successful"]["mean"] == math.inf
+    assert math.isnan(saved_rps["successful"]["median"])
+
+    loaded_report = GenerativeBenchmarksReport.load_file(mock_path)
+    loaded_rps = loaded_report.benchmarks[0].metrics.requests_per_second
+    assert loaded_rps.successful.mean == math.inf
+    assert math.isnan(loaded_rps.successful.median)
+
+    mock_path.unlink()
+
+
 def test_file_yaml():
     mock_benchmark = mock_generative_benchmark()
     report = GenerativeBenchmarksReport(benchmarks=[mock_benchmark])
@@ -81,6 +105,22 @@ def test_file_yaml():
     mock_path.unlink()
 
 
+def test_file_pickle():
+    mock_benchmark = mock_generative_benchmark()
+    report = GenerativeBenchmarksReport(benchmarks=[mock_benchmark])
+
+    mock_path = Path("mock_report.pkl")
+    report.save_file(mock_path)
+
+    loaded_report = GenerativeBenchmarksReport.load_file(mock_path)
+    loaded_benchmark = loaded_report.benchmarks[0]
+
+    for field in mock_benchmark.model_fields:
+        assert getattr(mock_benchmark, field) == getattr(loaded_benchmark, field)
+
+    mock_path.unlink()
+
+
 def test_file_csv():
     mock_benchmark = mock_generative_benchmark()
     report = GenerativeBenchmarksReport(benchmarks=[mock_benchmark])
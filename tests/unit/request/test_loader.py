@@ -0,0 +1,63 @@
+from itertools import islice
+
+import pytest
+
+from guidellm.request import GenerationRequest, GenerativeRequestLoader
+
+
+def _create_loader(**kwargs) -> GenerativeRequestLoader:
+    data = {
+        "prompt": [f"prompt {index}" for index in range(10)],
+        "prompt_tokens_count": list(range(10)),
+        "output_tokens_count": [index * 2 for index in range(10)],
+    }
+
+    return GenerativeRequestLoader(
+        data=data,
+        data_args=None,
+        processor=None,
+        processor_args=None,
+        **kwargs,
+    )
+
+
+@pytest.mark.smoke
+def test_generative_request_loader_requests(monkeypatch):
+    # batches smaller than the dataset so rows span multiple batches
+    monkeypatch.setattr(GenerativeRequestLoader, "ITER_BATCH_SIZE", 3)
+    loader = _create_loader(shuffle=False)
+    requests = list(loader)
+
+    assert len(loader) == 10
+    assert len(requests) == 10
+
+    for index, request in enumerate(requests):
+        assert isinstance(request, GenerationRequest)
+        assert request.content == f"prompt {index}"
+        assert request.stats == {"prompt_tokens": index}
+        assert request.constraints == {"output_tokens": index * 2}
+
+
+@pytest.mark.sanity
+def test_generative_request_loader_shuffle():
+    loader = _create_loader(shuffle=True, random_seed=42)
+    first_pass = [request.content for request in loader]
+    second_pass = [request.content for request in loader]
+    other_loader_pass = [
+        request.content for request in _create_loader(shuffle=True, random_seed=42)
+    ]
+
+    assert sorted(first_pass) == sorted(f"prompt {index}" for index in range(10))
+    assert first_pass != [f"prompt {index}" for index in range(10)]
+    assert first_pass == second_pass
+    assert first_pass == other_loader_pass
+
+
+@pytest.mark.sanity
+def test_generative_request_loader_infinite():
+    loader = _create_loader(shuffle=False, iter_type="infinite")
+    requests = list(islice(loader, 25))
+
+    assert [request.content for request in requests] == [
+        f"prompt {index % 10}" for index in range(25)
+    ]
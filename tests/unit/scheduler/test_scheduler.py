@@ -0,0 +1,205 @@
+import asyncio
+import queue
+import time
+from collections import Counter
+from typing import Optional
+
+import pytest
+
+from guidellm.scheduler import (
+    AsyncConstantStrategy,
+    ConcurrentStrategy,
+    RequestsWorker,
+    ResolveStatus,
+    Scheduler,
+    SchedulerRequestResult,
+    SchedulerRunInfo,
+    SchedulingStrategy,
+    SynchronousStrategy,
+    ThroughputStrategy,
+    WorkerDescription,
+)
+
+
+class _EchoWorker(RequestsWorker[str, str]):
+    # defined at module level so it can be pickled to the worker processes
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    @property
+    def description(self) -> WorkerDescription:
+        return WorkerDescription()
+
+    async def prepare_multiprocessing(self):
+        pass
+
+    async def resolve(
+        self, request: str, timeout_time: float
+    ) -> tuple[ResolveStatus, str]:
+        start = time.time()
+        await asyncio.sleep(self.delay)
+
+        return ResolveStatus(
+            requested=True,
+            completed=True,
+            errored=False,
+            canceled=False,
+            request_start=start,
+            request_end=time.time(),
+        ), f"response: {request}"
+
+
+class _InfiniteLoader:
+    def __iter__(self):
+        while True:
+            yield "request"
+
+    def __len__(self) -> int:
+        raise ValueError("Unable to determine length of dataset")
+
+
+def _requests(count: int):
+    for index in range(count):
+        yield f"request {index}"
+
+
+def _run_info(strategy: SchedulingStrategy, queued_requests: int) -> SchedulerRunInfo:
+    run_info = SchedulerRunInfo(
+        start_time=time.time(),
+        end_time=time.time() + 10,
+        end_number=10,
+        processes=1,
+        strategy=strategy,
+    )
+    run_info.queued_requests = queued_requests
+
+    return run_info
+
+
+async def _run_scheduler(
+    scheduler: Scheduler,
+    strategy: SchedulingStrategy,
+    max_number: Optional[int] = None,
+    max_duration: Optional[float] = None,
+) -> list:
+    return [
+        result
+        async for result in scheduler.run(
+            scheduling_strategy=strategy,
+            max_number=max_number,
+            max_duration=max_duration,
+        )
+    ]
+
+
+@pytest.mark.smoke
+def test_scheduler_request_loader_length():
+    sized = Scheduler(worker=_EchoWorker(), request_loader=["a", "b", "c"])
+    assert sized.request_loader_length == 3
+
+    unsized = Scheduler(worker=_EchoWorker(), request_loader=_requests(3))
+    assert unsized.request_loader_length is None
+
+    infinite = Scheduler(worker=_EchoWorker(), request_loader=_InfiniteLoader())
+    assert infinite.request_loader_length is None
+
+
+@pytest.mark.smoke
+def test_scheduler_requests_queue_full():
+    strategy = ConcurrentStrategy(streams=2)
+    assert not Scheduler._requests_queue_full(_run_info(strategy, 1))
+    assert Scheduler._requests_queue_full(_run_info(strategy, 2))
+    assert Scheduler._requests_queue_full(_run_info(strategy, 3))
+
+
+@pytest.mark.sanity
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        SynchronousStrategy(),
+        ConcurrentStrategy(streams=2),
+        ThroughputStrategy(max_concurrency=4),
+        AsyncConstantStrategy(rate=1000),
+    ],
+)
+async def test_scheduler_run_result_counts(strategy: SchedulingStrategy):
+    scheduler = Scheduler(worker=_EchoWorker(), request_loader=_requests(20))
+    results = await _run_scheduler(scheduler, strategy, max_number=10)
+
+    assert results[0].type_ == "run_start"
+    assert results[-1].type_ == "run_complete"
+    counts = Counter(result.type_ for result in results[1:-1])
+    assert counts["request_scheduled"] == 10
+    assert counts["request_start"] == 10
+    assert counts["request_complete"] == 10
+
+    run_info = results[-1].run_info
+    assert run_info.created_requests == 10
+    assert run_info.completed_requests == 10
+    assert run_info.queued_requests == 0
+    assert run_info.scheduled_requests == 0
+    assert run_info.processing_requests == 0
+
+    # every completed request carries a response, so none are filtered out
+    responses = sorted(
+        result.response
+        for result in results
+        if isinstance(result, SchedulerRequestResult)
+        and result.type_ == "request_complete"
+        and result.response is not None
+    )
+    assert responses == sorted(f"response: request {index}" for index in range(10))
+
+
+@pytest.mark.sanity
+@pytest.mark.asyncio
+async def test_scheduler_run_exhausts_loader():
+    scheduler = Scheduler(worker=_EchoWorker(), request_loader=["a", "b", "c"])
+    results = await _run_scheduler(scheduler, SynchronousStrategy())
+
+    assert results[-1].run_info.end_number == 3
+    assert results[-1].run_info.completed_requests == 3
+
+
+@pytest.mark.sanity
+@pytest.mark.asyncio
+async def test_scheduler_run_queue_back_pressure():
+    strategy = ConcurrentStrategy(streams=2)
+    scheduler = Scheduler(worker=_EchoWorker(delay=0.01), request_loader=_requests(20))
+    run_info = None
+
+    # requests are only added while the queue has room, so the locally tracked
+    # queue never grows past the strategy limit while results are yielded
+    async for result in scheduler.run(scheduling_strategy=strategy, max_number=20):
+        run_info = result.run_info
+        assert run_info.queued_requests <= strategy.queued_requests_limit
+        assert run_info.processing_requests <= strategy.processes_limit
+
+    assert run_info is not None
+    assert run_info.completed_requests == 20
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_scheduler_drain_responses_unpacks_batches():
+    responses_queue: queue.Queue = queue.Queue()
+    responses_bridge: asyncio.Queue = asyncio.Queue()
+    responses_queue.put(["first", "second"])
+    responses_queue.put(["third"])
+    responses_queue.put(None)
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        None,
+        Scheduler._drain_responses,
+        responses_queue,
+        responses_bridge,
+        loop,
+    )
+    await asyncio.sleep(0)
+
+    drained = []
+    while not responses_bridge.empty():
+        drained.append(responses_bridge.get_nowait())
+    assert drained == ["first", "second", "third"]
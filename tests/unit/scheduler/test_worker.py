@@ -0,0 +1,180 @@
+import asyncio
+import math
+import queue
+import time
+
+import pytest
+
+from guidellm.backend import StreamingTextResponse
+from guidellm.request import GenerationRequest
+from guidellm.scheduler import (
+    GenerativeRequestsWorker,
+    RequestsWorker,
+    ResolveStatus,
+    WorkerDescription,
+    WorkerProcessResult,
+)
+from tests.unit.mock_backend import MockBackend
+
+
+class _NoSuperInitWorker(RequestsWorker[str, str]):
+    def __init__(self, delay: float = 0.0):
+        # intentionally skips super().__init__()
+        self.delay = delay
+
+    @property
+    def description(self) -> WorkerDescription:
+        return WorkerDescription()
+
+    async def prepare_multiprocessing(self):
+        pass
+
+    async def resolve(
+        self, request: str, timeout_time: float
+    ) -> tuple[ResolveStatus, str]:
+        start = time.time()
+        await asyncio.sleep(self.delay)
+
+        return ResolveStatus(
+            requested=True,
+            completed=True,
+            errored=False,
+            canceled=False,
+            request_start=start,
+            request_end=time.time(),
+        ), f"response: {request}"
+
+
+class _StalledStreamBackend(MockBackend):
+    async def text_completions(self, *args, **kwargs):  # type: ignore[override]
+        start_time = time.time()
+
+        for index, delta in enumerate(["Hello", " world"]):
+            # iterations only carry their delta, as the OpenAI backend sends them
+            yield StreamingTextResponse(
+                type_="iter",
+                value="",
+                start_time=start_time,
+                first_iter_time=start_time,
+                iter_count=index + 1,
+                delta=delta,
+                time=time.time(),
+            )
+
+        await asyncio.sleep(10)
+
+
+def _collect_results(results_queue: queue.Queue) -> list[WorkerProcessResult]:
+    results = []
+    while not results_queue.empty():
+        batch = results_queue.get_nowait()
+        assert isinstance(batch, list)
+        results.extend(batch)
+
+    return results
+
+
+async def _resolve(
+    worker: RequestsWorker,
+    results_queue: queue.Queue,
+    request: str,
+):
+    now = time.time()
+    await worker.resolve_scheduler_request(
+        request=request,
+        queued_time=now,
+        dequeued_time=now,
+        start_time=now,
+        timeout_time=math.inf,
+        results_queue=results_queue,  # type: ignore[arg-type]
+        process_id=0,
+    )
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_worker_without_super_init_sends_results():
+    worker = _NoSuperInitWorker()
+    results_queue: queue.Queue = queue.Queue()
+
+    await _resolve(worker, results_queue, "test")
+    await asyncio.sleep(0.1)  # let the background sends finish
+
+    results = _collect_results(results_queue)
+    assert [result.type_ for result in results] == [
+        "request_scheduled",
+        "request_start",
+        "request_complete",
+    ]
+    assert results[-1].response == "response: test"
+
+
+@pytest.mark.sanity
+@pytest.mark.asyncio
+async def test_worker_batches_results_in_order():
+    worker = _NoSuperInitWorker(delay=0.01)
+    results_queue: queue.Queue = queue.Queue()
+
+    await asyncio.gather(
+        *(_resolve(worker, results_queue, f"test-{index}") for index in range(10))
+    )
+    await asyncio.sleep(0.1)  # let the background sends finish
+
+    puts = results_queue.qsize()
+    results = _collect_results(results_queue)
+    assert len(results) == 30
+    assert puts < len(results)
+
+    for index in range(10):
+        types = [
+            result.type_ for result in results if result.request == f"test-{index}"
+        ]
+        assert types == ["request_scheduled", "request_start", "request_complete"]
+
+
+@pytest.mark.sanity
+@pytest.mark.asyncio
+async def test_generative_worker_timeout_joins_deltas():
+    worker = GenerativeRequestsWorker(backend=_StalledStreamBackend())
+    request = GenerationRequest(content="test", request_type="text_completions")
+
+    status, response = await worker.resolve(request, timeout_time=time.time() + 0.1)
+
+    assert status.canceled
+    assert response.value == "Hello world"
+    assert response.response_output_tokens == 2
+
+
+class _CloseTrackingBackend(MockBackend):
+    def __init__(self):
+        super().__init__()
+        self.close_count = 0
+
+    async def close(self):
+        self.close_count += 1
+
+
+@pytest.mark.sanity
+@pytest.mark.parametrize("processing_mode", ["sync", "async"])
+def test_generative_worker_closes_backend_after_process_loop(processing_mode: str):
+    backend = _CloseTrackingBackend()
+    worker = GenerativeRequestsWorker(backend=backend)
+    requests_queue: queue.Queue = queue.Queue()
+    requests_queue.put(None)
+
+    if processing_mode == "sync":
+        worker.process_loop_synchronous(
+            requests_queue,  # type: ignore[arg-type]
+            queue.Queue(),  # type: ignore[arg-type]
+            process_id=0,
+        )
+    else:
+        worker.process_loop_asynchronous(
+            requests_queue,  # type: ignore[arg-type]
+            queue.Queue(),  # type: ignore[arg-type]
+            max_concurrency=1,
+            process_id=0,
+        )
+
+    # once after validating the backend and once when the process loop exits
+    assert backend.close_count == 2